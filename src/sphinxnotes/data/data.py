@@ -11,7 +11,7 @@ Core type definitions.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 import re
-from dataclasses import dataclass, asdict, field as dataclass_field
+from dataclasses import dataclass, field as dataclass_field
 from ast import literal_eval
 
 from .utils import Unpicklable
@@ -245,13 +245,28 @@ class ParsedData:
         - You can NOT access ``Data.attrs['name']`` by "{{ name }}" cause
         the variable name is taken by ``Data.name``.
         """
-        ctx = asdict(self)
-        for k, v in self.attrs.items():
+        # NOTE: Templates can modify the context (e.g. ``{% do attrs.pop('k') %}``),
+        # so containers are copied to keep data untouched. Values are scalars or
+        # flat containers of scalars (see :cls:`Form`), copying one level is
+        # enough and much faster than :func:`dataclasses.asdict`, which deep
+        # copies values recursively.
+        attrs = {k: _copy_value(v) for k, v in self.attrs.items()}
+        ctx = {
+            'name': _copy_value(self.name),
+            'attrs': attrs,
+            'content': _copy_value(self.content),
+        }
+        for k, v in attrs.items():
             if k not in ctx:
                 ctx[k] = v
         return ctx
 
 
+def _copy_value(v: Value) -> Value:
+    # Tuples and scalars are immutable, no need to copy.
+    return v.copy() if isinstance(v, (list, set)) else v
+
+
 @dataclass
 class Field(Unpicklable):
     #: Type of element.
@@ -339,6 +354,10 @@ class Field(Unpicklable):
         raise AttributeError(name)
 
 
+_FORM_OF_RE = re.compile(r'^([a-zA-Z_]+)\s+of\s+([a-zA-Z_]+)$')
+_BY_OPTION_RE = re.compile(r'^([a-zA-Z_]+)\s+by\s+(.+)$', re.IGNORECASE)
+
+
 @dataclass
 class DSLParser:
     field: Field
@@ -352,6 +371,10 @@ class DSLParser:
 
     def _split_modifiers(self, text: str) -> list[str]:
         """Splits the DSL string by comma, ignoring commas inside quotes."""
+        if '"' not in text and "'" not in text:
+            # Fast path: no quote, no comma needs to be ignored.
+            return text.split(',')
+
         parts, current, quote_char = [], [], None
 
         for ch in text:
@@ -378,8 +401,13 @@ class DSLParser:
         clean_mod = mod.strip()
         lower_mod = clean_mod.lower()
 
+        # Match: Type only (e.g., "int"), the most common case.
+        if lower_mod in REGISTRY.etypes:
+            self.field.etype = REGISTRY.etypes[lower_mod]
+            return
+
         # Match: XXX of XXX (e.g., "list of int")
-        if match := re.match(r'^([a-zA-Z_]+)\s+of\s+([a-zA-Z_]+)$', lower_mod):
+        if match := _FORM_OF_RE.match(lower_mod):
             form, etype = match.groups()
 
             if etype not in REGISTRY.etypes:
@@ -398,13 +426,8 @@ class DSLParser:
             self.field.flags[REGISTRY._sep_by_option.name] = REGISTRY.forms[form].sep
             return
 
-        # Match: Type only (e.g., "int")
-        if lower_mod in REGISTRY.etypes:
-            self.field.etype = REGISTRY.etypes[lower_mod]
-            return
-
         # Match: by-option, "XXX by XXX" (e.g., "sep by '|'")
-        if match := re.match(r'^([a-zA-Z_]+)\s+by\s+(.+)$', clean_mod, re.IGNORECASE):
+        if match := _BY_OPTION_RE.match(clean_mod):
             optname, rawval = match.groups()
 
             if optname not in REGISTRY.byopts:
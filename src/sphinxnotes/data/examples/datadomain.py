@@ -12,6 +12,7 @@ All directives and roles are added to a domain to prevent naming conflicts.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, override, cast
+from functools import cache
 
 from docutils import nodes
 from docutils.parsers.rst import directives
@@ -34,9 +35,16 @@ TEMPLATE_KEY = 'sphinxnotes-data:template'
 SCHEMA_KEY = 'sphinxnotes-data:schema'
 
 
+# Phase.PostTranform is not supported yet: the pending nodes are still in
+# doctree when it is pickled, which breaks the build.
+_PHASE_BY_VALUE = {x.value: x for x in Phase if x != Phase.PostTranform}
+_PHASE_VALUES = tuple(_PHASE_BY_VALUE)
+
+
 def phase_option_spec(arg):
-    choice = directives.choice(arg, [x.value for x in Phase])
-    return Phase[choice.title()]
+    if arg and arg.strip().lower() == Phase.PostTranform:
+        raise ValueError(f'phase "{Phase.PostTranform}" is not supported yet')
+    return _PHASE_BY_VALUE[directives.choice(arg, _PHASE_VALUES)]
 
 
 class TemplateDefineDirective(SphinxDirective):
@@ -56,6 +64,7 @@ class TemplateDefineDirective(SphinxDirective):
         return []
 
     @staticmethod
+    @cache
     def directive_preset() -> Template:
         return Template("""
 .. note::
@@ -73,6 +82,7 @@ class TemplateDefineDirective(SphinxDirective):
         {{ content or 'None' }}""")
 
     @staticmethod
+    @cache
     def role_preset() -> Template:
         return Template("""``{{ content or 'None' }}``
 :abbr:`ⁱⁿᶠᵒ (This is a default template for rendering the data your deinfed
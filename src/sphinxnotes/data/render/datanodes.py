@@ -17,7 +17,7 @@ from ..utils import (
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Callable
+    from typing import Any, Callable, Sequence
     from .markup import Host
 
 
@@ -35,6 +35,8 @@ class pending_node(Base, Unpicklable):
     inline: bool
     #: Whether the rendering pipeline is finished (failed is also finished).
     rendered: bool
+    #: System messages generated when parsing markup text to inline nodes.
+    _parser_msgs: Sequence[nodes.system_message] = ()
 
     def __init__(
         self,
@@ -52,16 +54,13 @@ class pending_node(Base, Unpicklable):
         self.inline = inline
         self.rendered = False
 
-        # Init hook lists.
-        self._raw_data_hooks = []
-        self._parsed_data_hooks = []
-        self._markup_text_hooks = []
-        self._rendered_nodes_hooks = []
-
-    def render(self, host: Host) -> None:
+    def render(self, host: Host, renderer: MarkupRenderer | None = None) -> None:
         """
         The core function for rendering data to docutils nodes.
 
+        A :cls:`MarkupRenderer` of the host can be passed in to share it
+        between nodes rendered by the same host.
+
         1. Schema.parse(RawData) -> ParsedData
         2. TemplateRenderer.render(ParsedData) -> Markup Text (``str``)
         3. MarkupRenderer.render(Markup Text) -> doctree Nodes (list[nodes.Node])
@@ -71,26 +70,25 @@ class pending_node(Base, Unpicklable):
         assert not self.rendered
         self.rendered = True
 
-        report = Report(
-            'Render Debug Report', 'DEBUG', source=self.source, line=self.line
-        )
+        # Dumping intermediate products is costly, only do it when necessary.
+        # The report is created up front in debug mode, otherwise it is only
+        # created when rendering fails.
+        report = self._new_report() if self.template.debug else None
 
         # 1. Prepare context for Jinja template.
+        pending = None
         if isinstance(self.data, PendingData):
-            report.text('Raw data:')
-            report.code(pformat(self.data.raw), lang='python')
-            report.text('Schema:')
-            report.code(pformat(self.data.schema), lang='python')
+            pending = self.data
+            if report:
+                self._report_raw_data(report, pending)
 
             for hook in self._raw_data_hooks:
-                hook(self, self.data.raw)
+                hook(self, pending.raw)
 
             try:
-                data = self.data = self.data.parse()
+                data = self.data = pending.parse()
             except ValueError:
-                report.text('Failed to parse raw data:')
-                report.excption()
-                self += report
+                self._report_failure(report, 'Failed to parse raw data:', pending)
                 return
         else:
             data = self.data
@@ -98,45 +96,50 @@ class pending_node(Base, Unpicklable):
         for hook in self._parsed_data_hooks:
             hook(self, data)
 
-        report.text(f'Parsed data (type: {type(data)}):')
-        report.code(pformat(data), lang='python')
-        report.text('Extra context (only keys):')
-        report.code(pformat(list(self.extra.keys())), lang='python')
-        report.text(f'Template (phase: {self.template.phase}):')
-        report.code(self.template.text, lang='jinja')
+        if report:
+            self._report_context(report, data)
 
         # 2. Render the template and data to markup text.
         try:
-            markup = TemplateRenderer(self.template.text).render(data, extra=self.extra)
+            markup = TemplateRenderer(self.template).render(data, extra=self.extra)
         except Exception:
-            report.text('Failed to render Jinja template:')
-            report.excption()
-            self += report
+            self._report_failure(
+                report, 'Failed to render Jinja template:', pending, data
+            )
             return
 
         for hook in self._markup_text_hooks:
             markup = hook(self, markup)
 
-        report.text('Rendered markup text:')
-        report.code(markup, lang='rst')
+        if report:
+            self._report_markup(report, markup)
 
         # 3. Render the markup text to doctree nodes.
         try:
-            ns, msgs = MarkupRenderer(host).render(markup, inline=self.inline)
+            renderer = renderer or MarkupRenderer(host)
+            ns, msgs = renderer.render(markup, inline=self.inline)
         except Exception:
-            report.text(
+            self._report_failure(
+                report,
                 'Failed to render markup text '
-                f'to {"inline " if self.inline else ""}nodes:'
+                f'to {"inline " if self.inline else ""}nodes:',
+                pending,
+                data,
+                markup,
             )
-            report.excption()
-            self += report
             return
 
-        report.text(f'Rendered nodes (inline: {self.inline}):')
-        report.code('\n\n'.join([n.pformat() for n in ns]), lang='xml')
+        if report:
+            report.text(f'Rendered nodes (inline: {self.inline}):')
+            report.code('\n\n'.join([n.pformat() for n in ns]), lang='xml')
+            if msgs:
+                # Only summarize messages, the message nodes stay where they are.
+                report.text('System messages:')
+                report.list(m.astext() for m in msgs)
         if msgs:
-            report.text('Systemd messages:')
-            [report.node(msg) for msg in msgs]
+            # System messages are referenced by the problematic nodes generated
+            # by parser, return them along with nodes in :meth:`unwrap_inline`.
+            self._parser_msgs = msgs
 
         # 4. Add rendered nodes to container.
         for hook in self._rendered_nodes_hooks:
@@ -144,13 +147,66 @@ class pending_node(Base, Unpicklable):
         # TODO: set_source_info?
         self += ns
 
-        if self.template.debug:
+        if report:
             self += report
 
         Reporter(self).clear_empty()
 
         return
 
+    def _new_report(self) -> Report:
+        return Report(
+            'Render Debug Report', 'DEBUG', source=self.source, line=self.line
+        )
+
+    def _report_raw_data(self, report: Report, pending: PendingData) -> None:
+        report.text('Raw data:')
+        report.code(pformat(pending.raw), lang='python')
+        report.text('Schema:')
+        report.code(pformat(pending.schema), lang='python')
+
+    def _report_context(
+        self, report: Report, data: ParsedData | dict[str, Any]
+    ) -> None:
+        report.text(f'Parsed data (type: {type(data)}):')
+        report.code(pformat(data), lang='python')
+        report.text('Extra context (only keys):')
+        # Keys are plain strings, join them rather than pretty-printing.
+        report.code(f'[{", ".join(map(repr, self.extra))}]', lang='python')
+        report.text(f'Template (phase: {self.template.phase}):')
+        report.code(self.template.text, lang='jinja')
+
+    def _report_markup(self, report: Report, markup: str) -> None:
+        report.text('Rendered markup text:')
+        report.code(markup, lang='rst')
+
+    def _report_failure(
+        self,
+        report: Report | None,
+        msg: str,
+        pending: PendingData | None = None,
+        data: ParsedData | dict[str, Any] | None = None,
+        markup: str | None = None,
+    ) -> None:
+        """
+        Report the exception being handled.
+
+        If no report is created up front (not in debug mode), a new one is
+        created with the given intermediate products dumped, which are
+        needed for diagnosing the failure.
+        """
+        if report is None:
+            report = self._new_report()
+            if pending is not None:
+                self._report_raw_data(report, pending)
+            if data is not None:
+                self._report_context(report, data)
+            if markup is not None:
+                self._report_markup(report, markup)
+        report.text(msg)
+        report.excption()
+        self += report
+
     def unwrap(self) -> list[nodes.Node]:
         children = self.children
         self.clear()
@@ -168,7 +224,10 @@ class pending_node(Base, Unpicklable):
         children = self.children
         self.clear()
 
-        return children, [x for x in reports]
+        msgs = [*reports, *self._parser_msgs]
+        self._parser_msgs = ()
+
+        return children, msgs
 
     def unwrap_and_replace_self(self) -> None:
         children = self.unwrap()
@@ -194,19 +253,21 @@ class pending_node(Base, Unpicklable):
     type MarkupTextHook = Callable[[pending_node, str], str]
     type RenderedNodesHook = Callable[[pending_node, list[nodes.Node]], None]
 
-    _raw_data_hooks: list[RawDataHook]
-    _parsed_data_hooks: list[ParsedDataHook]
-    _markup_text_hooks: list[MarkupTextHook]
-    _rendered_nodes_hooks: list[RenderedNodesHook]
+    # Most nodes have no hooks, so hook lists default to a shared empty tuple
+    # and are only allocated for a node when the first hook is added.
+    _raw_data_hooks: Sequence[RawDataHook] = ()
+    _parsed_data_hooks: Sequence[ParsedDataHook] = ()
+    _markup_text_hooks: Sequence[MarkupTextHook] = ()
+    _rendered_nodes_hooks: Sequence[RenderedNodesHook] = ()
 
     def hook_raw_data(self, hook: RawDataHook) -> None:
-        self._raw_data_hooks.append(hook)
+        self._raw_data_hooks = [*self._raw_data_hooks, hook]
 
     def hook_parsed_data(self, hook: ParsedDataHook) -> None:
-        self._parsed_data_hooks.append(hook)
+        self._parsed_data_hooks = [*self._parsed_data_hooks, hook]
 
     def hook_markup_text(self, hook: MarkupTextHook) -> None:
-        self._markup_text_hooks.append(hook)
+        self._markup_text_hooks = [*self._markup_text_hooks, hook]
 
     def hook_rendered_nodes(self, hook: RenderedNodesHook) -> None:
-        self._rendered_nodes_hooks.append(hook)
+        self._rendered_nodes_hooks = [*self._rendered_nodes_hooks, hook]
@@ -8,11 +8,12 @@ from docutils.parsers.rst.roles import _roles
 
 from .render import HostWrapper
 from .datanodes import pending_node
+from .template import TemplateRenderer
 from ..utils import find_current_section, Report, Reporter
 from ..utils.ctxproxy import proxy
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, ClassVar
+    from typing import Any, Callable, ClassVar, Iterable
     from sphinx.application import Sphinx
     from .render import ParseHost, TransformHost
 
@@ -156,21 +157,28 @@ class ExtraContextGenerator:
         Reporter(node).append(self.report)
 
     def on_anytime(self) -> None:
-        for name, ctxgen in self.registry.global_.items():
+        for name, ctxgen in self._referenced(self.registry.global_):
             self._safegen(name, lambda: ctxgen.generate())
 
     def on_parsing(self, host: ParseHost) -> None:
-        for name, ctxgen in self.registry.parsing.items():
+        for name, ctxgen in self._referenced(self.registry.parsing):
             self._safegen(name, lambda: ctxgen.generate(host))
 
     def on_parsed(self, host: ParseHost) -> None:
-        for name, ctxgen in self.registry.parsed.items():
+        for name, ctxgen in self._referenced(self.registry.parsed):
             self._safegen(name, lambda: ctxgen.generate(host))
 
     def on_post_transform(self, host: TransformHost) -> None:
-        for name, ctxgen in self.registry.post_transform.items():
+        for name, ctxgen in self._referenced(self.registry.post_transform):
             self._safegen(name, lambda: ctxgen.generate(host))
 
+    def _referenced[T](self, ctxgens: dict[str, T]) -> Iterable[tuple[str, T]]:
+        """Skip the context generators whose name is not referenced by template."""
+        needed = TemplateRenderer(self.node.template).variables()
+        if needed is None:
+            return ctxgens.items()
+        return [(k, v) for k, v in ctxgens.items() if k in needed]
+
     def _safegen(self, name: str, gen: Callable[[], Any]):
         try:
             # ctxgen.generate can be user-defined code, exception of any kind are possible.
@@ -9,8 +9,8 @@ Rendering markup text to doctree nodes.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
 
 from docutils import nodes
 from docutils.parsers.rst.states import Struct
@@ -22,56 +22,109 @@ from sphinx import version_info
 from .render import Host
 
 if TYPE_CHECKING:
+    from typing import Callable
     from docutils.nodes import Node, system_message
+    from docutils.parsers import Parser
+    from sphinx.application import Sphinx
 
+type _Render = Callable[[str], list[Node]]
+type _InlineRender = Callable[[str], tuple[list[Node], list[system_message]]]
 
-@dataclass
+
+@dataclass(slots=True)
 class MarkupRenderer:
     host: Host
+    #: Memo for parsing inline markup in role, which is read-only to parser.
+    _memo: Struct | None = field(default=None, init=False, repr=False)
+    #: Render implementations resolved from type of host.
+    _render_impl: _Render = field(init=False, repr=False)
+    _render_inline_impl: _InlineRender = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Dispatch by type of host once, rather than for every render.
+        if isinstance(self.host, SphinxDirective):
+            self._render_impl = self.host.parse_text_to_nodes
+            self._render_inline_impl = self.host.parse_inline
+        elif isinstance(self.host, SphinxRole):
+            self._render_impl = self._unsupported
+            self._render_inline_impl = self._role_render_inline
+        elif isinstance(self.host, SphinxTransform):
+            self._render_impl = self._transform_render
+            self._render_inline_impl = self._transform_render_inline
+        else:
+            raise NotImplementedError
 
     def render(
         self, text: str, inline: bool = False
     ) -> tuple[list[Node], list[system_message]]:
+        # Templates often render to blank text when data is missing, there is
+        # nothing to parse.
+        if not text:
+            return [], []
         if inline:
-            return self._render_inline(text)
+            # Whitespace is content of inline markup, so it is still parsed.
+            return self._render_inline_impl(text)
+        elif text.isspace():
+            return [], []
         else:
-            return self._render(text), []
+            return self._render_impl(text), []
 
-    def _render(self, text: str) -> list[Node]:
-        if isinstance(self.host, SphinxDirective):
-            return self.host.parse_text_to_nodes(text)
-        elif isinstance(self.host, SphinxTransform):
-            # TODO: dont create parser for every time
-            if version_info[0] >= 9:
-                parser = self.host.app.registry.create_source_parser('rst', env=self.host.env, config=self.host.config)
-            else:
-                parser = self.host.app.registry.create_source_parser(self.host.app, 'rst')
-            settings = self.host.document.settings
-            doc = new_document('<generated text>', settings=settings)
-            parser.parse(text, doc)
-            return doc.children
-        else:
-            assert False
+    def _unsupported(self, text: str) -> list[Node]:
+        raise NotImplementedError(
+            f'Block level rendering is not supported by {type(self.host)}'
+        )
 
-    def _render_inline(self, text: str) -> tuple[list[Node], list[system_message]]:
-        if isinstance(self.host, SphinxDirective):
-            return self.host.parse_inline(text)
-        if isinstance(self.host, SphinxRole):
-            inliner = self.host.inliner
-            memo = Struct(
+    def _role_render_inline(self, text: str) -> tuple[list[Node], list[system_message]]:
+        host = cast(SphinxRole, self.host)
+        inliner = host.inliner
+        # Role instance may be reused across documents, rebuild the memo
+        # when the document is changed.
+        if self._memo is None or self._memo.document is not inliner.document:
+            self._memo = Struct(
                 document=inliner.document,
                 reporter=inliner.reporter,
                 language=inliner.language,
             )
+        return inliner.parse(text, host.lineno, self._memo, inliner.parent)
 
-            return inliner.parse(text, self.host.lineno, memo, inliner.parent)
-        elif isinstance(self.host, SphinxTransform):
-            # Fallback to normal non-inline render then extract inline
-            # elements by self.
-            # FIXME: error seems be ignored?
-            ns = self._render(text)
-            if ns and isinstance(ns[0], nodes.paragraph):
-                ns = ns[0].children
-            return ns, []
-        else:
-            assert False
+    def _transform_render(self, text: str) -> list[Node]:
+        host = cast(SphinxTransform, self.host)
+        parser = _get_rst_parser(host.app)
+        settings = host.document.settings
+        doc = new_document('<generated text>', settings=settings)
+        parser.parse(text, doc)
+        return doc.children
+
+    def _transform_render_inline(
+        self, text: str
+    ) -> tuple[list[Node], list[system_message]]:
+        # Fallback to normal non-inline render then extract inline
+        # elements by self.
+        # FIXME: error seems be ignored?
+        ns = self._transform_render(text)
+        if ns and isinstance(ns[0], nodes.paragraph):
+            ns = ns[0].children
+        return ns, []
+
+
+# Attribute name of the reStructuredText parser cached on app.
+_RST_PARSER_ATTR = '_sphinxnotes_data_rst_parser'
+
+
+def _get_rst_parser(app: Sphinx) -> Parser:
+    """
+    Get reStructuredText parser for the app. The parser is reusable as it
+    creates a new state machine for each parse.
+
+    The parser is cached on the app, so it is released together with the app.
+    """
+    if parser := getattr(app, _RST_PARSER_ATTR, None):
+        return parser
+    if version_info[0] >= 9:
+        parser = app.registry.create_source_parser(
+            'rst', env=app.env, config=app.config
+        )
+    else:
+        parser = app.registry.create_source_parser(app, 'rst')
+    setattr(app, _RST_PARSER_ATTR, parser)
+    return parser
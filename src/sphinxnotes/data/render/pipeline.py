@@ -52,6 +52,7 @@ from sphinx.transforms.post_transforms import SphinxPostTransform, ReferencesRes
 
 from .render import HostWrapper, Phase, Template, Host, ParseHost, TransformHost
 from .datanodes import pending_node
+from .markup import MarkupRenderer
 from .extractx import ExtraContextGenerator
 from ..data import RawData, PendingData, ParsedData, Schema
 
@@ -119,18 +120,27 @@ class Pipeline(ABC):
         """
 
         ns = []
+        # Markup renderer shared by pending nodes rendered in this call.
+        # It is not kept on host: a host (e.g. role instance) may be reused
+        # across documents, while the renderer is bound to current document.
+        renderer = None
         while self._q:
             pending = self._q.pop()
 
             if not self.process_pending_node(pending):
-                ns.append(pending)
+                # Not the time to render, pending node that already in
+                # document is left in place for later phases.
+                if pending.parent is None:
+                    ns.append(pending)
                 continue
 
             # Generate global extra context for later use.
             ExtraContextGenerator(pending).on_anytime()
 
             host = cast(Host, self)
-            pending.render(host)
+            if renderer is None:
+                renderer = MarkupRenderer(host)
+            pending.render(host, renderer)
 
             if pending.parent is None:
                 ns.append(pending)
@@ -233,8 +243,12 @@ class BaseDataDefineRole(BaseDataDefiner, SphinxRole):
 
 
 class _ParsedHook(SphinxDirective, Pipeline):
+    #: The pending node being processed.
+    _current: pending_node | None = None
+
     @override
     def process_pending_node(self, n: pending_node) -> bool:
+        self._current = n
         self.state.document.note_source(n.source, n.line)  # type: ignore[arg-type]
 
         # Generate and save parsed extra context for later use.
@@ -246,16 +260,27 @@ class _ParsedHook(SphinxDirective, Pipeline):
     def run(self) -> list[nodes.Node]:
         for pending in self.state.document.findall(pending_node):
             self.queue_pending_node(pending)
-            # Hook system_message method to let it report the
-            # correct line number.
-            # TODO: self.state.document.note_source(source, line)  # type: ignore[arg-type]
-            # def fix_lineno(level, message, *children, **kwargs):
-            #     kwargs['line'] = pending.line
-            #     return orig_sysmsg(level, message, *children, **kwargs)
 
-            # self.state_machine.reporter.system_message = fix_lineno
-
-        ns = self.render_queue()
+        # Hook system_message method once for all pending nodes to let it
+        # report the line number of the node being processed, rather than
+        # the line number of this hook directive.
+        reporter = self.state_machine.reporter
+        orig_sysmsg = reporter.system_message
+
+        def fix_lineno(level, message, *children, **kwargs):
+            if self._current is not None:
+                # Pass source together with line, otherwise docutils treats
+                # the line as an offset of state machine input.
+                kwargs['source'] = self._current.source
+                kwargs['line'] = self._current.line
+            return orig_sysmsg(level, message, *children, **kwargs)
+
+        reporter.system_message = fix_lineno
+        try:
+            ns = self.render_queue()
+        finally:
+            reporter.system_message = orig_sysmsg
+            self._current = None
         assert len(ns) == 0
 
         return []  # nothing to return
@@ -1,13 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
 from docutils import nodes
 from sphinx.transforms import SphinxTransform
 from sphinx.util.docutils import SphinxDirective, SphinxRole
 
 
-class Phase(Enum):
+class Phase(StrEnum):
     Parsing = 'parsing'
     Parsed = 'parsed'
     PostTranform = 'post-transform'
@@ -18,7 +18,7 @@ class Phase(Enum):
         return cls.Parsing
 
 
-@dataclass
+@dataclass(slots=True)
 class Template:
     #: Jinja template for rendering the context.
     text: str
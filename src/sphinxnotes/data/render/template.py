@@ -1,16 +1,22 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from pprint import pformat
 from typing import TYPE_CHECKING, override
 
 from jinja2.sandbox import SandboxedEnvironment
-from jinja2 import StrictUndefined, DebugUndefined
+from jinja2 import Environment, StrictUndefined, DebugUndefined
+from jinja2 import TemplateSyntaxError, meta
+from jinja2.ext import LoopControlExtension, ExprStmtExtension, DebugExtension
 
+from .render import Template
 from ..data import ParsedData
 from ..utils import Report
 
 if TYPE_CHECKING:
-    from typing import Any, Iterable
+    from typing import Any, Iterable, Callable
+    from jinja2 import Template as JinjaTemplate
+    from jinja2.ext import Extension
     from sphinx.application import Sphinx
     from sphinx.environment import BuildEnvironment
     from sphinx.builders import Builder
@@ -18,7 +24,7 @@ if TYPE_CHECKING:
 
 @dataclass
 class TemplateRenderer:
-    text: str
+    tmpl: Template
 
     def render(
         self,
@@ -32,58 +38,96 @@ class TemplateRenderer:
             debug.text('Data:')
             debug.code(pformat(data), lang='python')
             debug.text('Extra context (just key):')
-            debug.code(pformat(list(extra.keys())), lang='python')
+            debug.code(f'[{", ".join(map(repr, extra))}]', lang='python')
 
         # Convert data to context dict.
-        if isinstance(data, ParsedData):
-            ctx = data.asdict()
-        elif isinstance(data, dict):
-            ctx = data.copy()
-
-        # Merge extra context and main context.
-        conflicts = set()
-        for name, e in extra.items():
-            if name not in ctx:
-                ctx[name] = e
-            else:
-                conflicts.add(name)
+        main = data.asdict() if isinstance(data, ParsedData) else data
+
+        # Merge extra context and main context, main context takes precedence
+        # on conflicts.
+        ctx = {**extra, **main}
 
         text = self._render(ctx, debug=debug is not None)
 
         return text
 
     def _render(self, ctx: dict[str, Any], debug: bool = False) -> str:
-        extensions = [
-            'jinja2.ext.loopcontrols',  # enable {% break %}, {% continue %}
-            'jinja2.ext.do',  # enable {% do ... %}
-        ]
-        if debug:
-            extensions.append('jinja2.ext.debug')
-
-        env = _JinjaEnv(
-            undefined=DebugUndefined if debug else StrictUndefined,
-            extensions=extensions,
-        )
-        # TODO: cache jinja env
+        if not self.tmpl.text:
+            return ''
+        # Compiled templates are cached per build rather than kept on
+        # the Template, which may outlive the build.
+        return _compile(self.tmpl.text, debug).render(ctx)
 
-        return env.from_string(self.text).render(ctx)
+    def variables(self) -> frozenset[str] | None:
+        """
+        Return names of the variables referenced by template, or None if it
+        can not be determined (template has syntax error).
+        """
+        return _undeclared_variables(self.tmpl.text)
 
     def _report_self(self, reporter: Report) -> None:
         reporter.text('Template:')
-        reporter.code(self.text, lang='jinja')
+        reporter.code(self.tmpl.text, lang='jinja')
 
 
-class _JinjaEnv(SandboxedEnvironment):
+class _JinjaEnv(Environment):
     _builder: Builder
     # List of user defined filter factories.
     _filter_factories = {}
+    # Filters created by factories for current build.
+    _filters: dict[str, Callable] = {}
+    # Shared environments of current build, keyed by debug flag.
+    _envs: dict[bool, _JinjaEnv] = {}
+    # Whether to render template in sandbox, see ``data_jinja_sandbox``.
+    _sandbox: bool = True
 
     @classmethod
     def _on_builder_inited(cls, app: Sphinx):
+        # A previous build in the same process may not reach build-finished,
+        # drop anything left by it.
+        cls._reset()
         cls._builder = app.builder
+        cls._sandbox = app.config.data_jinja_sandbox
+        # Create filters once per build rather than once per environment.
+        cls._filters = {
+            name: factory(app.builder.env)
+            for name, factory in cls._filter_factories.items()
+        }
+
+    @classmethod
+    def _on_build_finished(cls, app: Sphinx, exception):
+        cls._reset()
 
     @classmethod
-    def _on_build_finished(cls, app: Sphinx, exception): ...
+    def _reset(cls) -> None:
+        # Environments and compiled templates hold filters bound to the
+        # build environment of a build.
+        cls._envs.clear()
+        cls._filters = {}
+        _compile.cache_clear()
+
+    @classmethod
+    def get(cls, debug: bool = False) -> _JinjaEnv:
+        """Get the shared environment of current build."""
+        if env := cls._envs.get(debug):
+            return env
+
+        # Pass extension classes to save Jinja from importing them by name.
+        extensions: list[type[Extension]] = [
+            LoopControlExtension,  # enable {% break %}, {% continue %}
+            ExprStmtExtension,  # enable {% do ... %}
+        ]
+        if debug:
+            extensions.append(DebugExtension)
+
+        envcls = _SandboxedJinjaEnv if cls._sandbox else _JinjaEnv
+        env = cls._envs[debug] = envcls(
+            undefined=DebugUndefined if debug else StrictUndefined,
+            extensions=extensions,
+            # Templates are compiled from string, there is nothing to reload.
+            auto_reload=False,
+        )
+        return env
 
     @classmethod
     def add_filter(cls, name: str, ff):
@@ -91,9 +135,10 @@ class _JinjaEnv(SandboxedEnvironment):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for name, factory in self._filter_factories.items():
-            self.filters[name] = factory(self._builder.env)
+        self.filters.update(self._filters)
 
+
+class _SandboxedJinjaEnv(SandboxedEnvironment, _JinjaEnv):
     @override
     def is_safe_attribute(self, obj, attr, value=None):
         """
@@ -108,6 +153,22 @@ class _JinjaEnv(SandboxedEnvironment):
         return super().is_safe_attribute(obj, attr, value)
 
 
+@lru_cache(maxsize=1024)
+def _compile(text: str, debug: bool = False) -> JinjaTemplate:
+    """Compile Jinja template, the result is cached by template text."""
+    return _JinjaEnv.get(debug).from_string(text)
+
+
+@lru_cache(maxsize=1024)
+def _undeclared_variables(text: str) -> frozenset[str] | None:
+    try:
+        ast = _JinjaEnv.get().parse(text)
+    except TemplateSyntaxError:
+        # Let the error be reported when rendering.
+        return None
+    return frozenset(meta.find_undeclared_variables(ast))
+
+
 def _roles_filter(env: BuildEnvironment):
     """
     Fetch artwork picture by ID and install theme to Sphinx's source directory,
@@ -130,6 +191,8 @@ def _roles_filter(env: BuildEnvironment):
 
 
 def setup(app: Sphinx):
+    app.add_config_value('data_jinja_sandbox', True, 'env', bool)
+
     app.connect('builder-inited', _JinjaEnv._on_builder_inited)
     app.connect('build-finished', _JinjaEnv._on_build_finished)
 
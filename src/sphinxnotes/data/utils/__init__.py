@@ -114,7 +114,9 @@ class Report(nodes.system_message):
 
     def node(self, node: nodes.Node) -> None:
         self += node
-        self.log(f'report: {node.astext()}')
+        # Only warning and error are logged, skip the costly astext() for others.
+        if self['type'] in ('WARNING', 'ERROR'):
+            self.log(f'report: {node.astext()}')
 
     def log(self, msg: str) -> None:
         if self['type'] in 'ERROR':
@@ -186,11 +188,15 @@ class Reporter:
 
     def clear(self, pred: Callable[[Report], bool] | None = None) -> list[Report]:
         """Clear report children from node if pred returns True."""
-        msgs = []
-        for report in self.reports:
-            if not pred or pred(report):
-                msgs.append(report)
-                self.node.remove(report)
+        msgs, rest = [], []
+        for child in self.node.children:
+            if isinstance(child, Report) and (not pred or pred(child)):
+                msgs.append(child)
+            else:
+                rest.append(child)
+        # Rebuild children in one pass rather than removing reports one by one.
+        if msgs:
+            self.node.children[:] = rest
         return msgs
 
     def clear_empty(self) -> list[Report]:
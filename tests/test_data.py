@@ -4,7 +4,7 @@ import unittest
 
 sys.path.insert(0, os.path.abspath('./src/sphinxnotes'))
 
-from data.data import Field, REGISTRY
+from data.data import Field, ParsedData, REGISTRY
 
 class TestFieldParser(unittest.TestCase):
 
@@ -66,6 +66,11 @@ class TestFieldParser(unittest.TestCase):
     # Parsing Logic
     # ==========================
 
+    def test_modifiers_whitespace(self):
+        f = Field.from_dsl(' list of int ,  required ,')
+        self.assertEqual(f.parse('1,2'), [1, 2])
+        self.assertTrue(f.required)
+
     def test_empty_input(self):
         # Optional scalar -> None
         self.assertIsNone(Field.from_dsl('int').parse(None))
@@ -110,6 +115,27 @@ class TestFieldParser(unittest.TestCase):
         f = Field.from_dsl(r'int, index by year, index by month')
         self.assertEqual(f.index, ['year', 'month'])
 
+    # ==========================
+    # Parsed Data
+    # ==========================
+
+    def test_parsed_data_asdict(self):
+        d = ParsedData('foo', {'color': 'red', 'name': 'bar'}, None)
+        ctx = d.asdict()
+        self.assertEqual(ctx['name'], 'foo')
+        self.assertEqual(ctx['attrs'], {'color': 'red', 'name': 'bar'})
+        self.assertIsNone(ctx['content'])
+        # Attrs are lifted to top-level when there is no conflict.
+        self.assertEqual(ctx['color'], 'red')
+
+    def test_parsed_data_asdict_copy(self):
+        d = ParsedData('foo', {'tags': ['a', 'b']}, None)
+        ctx = d.asdict()
+        ctx['attrs'].pop('tags').append('c')
+        ctx['tags'].append('d')
+        # Modifying context does not touch the data.
+        self.assertEqual(d.attrs, {'tags': ['a', 'b']})
+
     # ==========================
     # Errors
     # ==========================
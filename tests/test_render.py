@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath('./src'))
+
+from sphinx.application import Sphinx
+
+
+def build(docs: dict[str, str]) -> tuple[dict[str, str], str]:
+    """Build documents with text builder, return outputs and warnings."""
+    with tempfile.TemporaryDirectory() as tmp:
+        srcdir = Path(tmp, 'src')
+        outdir = Path(tmp, 'out')
+        srcdir.mkdir()
+        (srcdir / 'conf.py').write_text("extensions = ['sphinxnotes.data']\n")
+        for name, text in docs.items():
+            (srcdir / f'{name}.rst').write_text(text)
+
+        warning = StringIO()
+        app = Sphinx(
+            srcdir,
+            srcdir,
+            outdir,
+            Path(tmp, 'doctrees'),
+            'text',
+            status=None,
+            warning=warning,
+            freshenv=True,
+        )
+        app.build()
+
+        outputs = {name: (outdir / f'{name}.txt').read_text() for name in docs}
+        return outputs, warning.getvalue()
+
+
+class TestRender(unittest.TestCase):
+    # ==========================
+    # Role
+    # ==========================
+
+    def test_role_across_documents(self):
+        # Role instance is shared by all documents, rendering in a document
+        # should not be affected by previous ones.
+        doc = """{name}
+=
+
+.. data:tmpl::
+
+   *unclosed {{{{ content }}}}
+
+Role :data:def:`{name}` end.
+"""
+        index = 'Index\n=====\n\n.. toctree::\n\n   a\n   b\n'
+        outputs, warnings = build(
+            {'index': index, 'a': doc.format(name='a'), 'b': doc.format(name='b')}
+        )
+
+        for name in ('a', 'b'):
+            self.assertIn(f'unclosed {name} end.', outputs[name])
+            self.assertNotIn('Report', outputs[name])
+            self.assertIn(f'{name}.rst:8: WARNING: Inline emphasis', warnings)
+
+    def test_role_whitespace(self):
+        # Whitespace rendered by template is content of inline markup.
+        doc = """Index
+=====
+
+.. data:tmpl::
+
+   {{ '   ' }}
+
+A\\ :data:def:`x`\\ B
+"""
+        outputs, _ = build({'index': doc})
+        self.assertIn('A   B', outputs['index'])
+
+
+if __name__ == '__main__':
+    unittest.main()